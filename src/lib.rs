@@ -6,25 +6,34 @@ mod tests;
 use std::fs::File as StdFile;
 use std::path::PathBuf;
 use std::io::Read;
+use std::io::BufReader;
 use std::error::Error as StdError;
 use std::path::Path;
 use yaserde::de::from_str;
 use serde_json::from_str as serde_from_str;
 use zip::ZipArchive;
+
+// Upper bound for presizing read buffers; entry sizes come from the untrusted archive header.
+const MAX_PRESIZE: u64 = 16 * 1024 * 1024;
+
+fn presize(size: u64) -> usize {
+    size.min(MAX_PRESIZE) as usize
+}
+
 impl GldfProduct {
     pub fn load_gldf_file_str(self: &Self, path: String) -> Result<String, Box<dyn StdError>> {
-        let zipfile = StdFile::open(Path::new(&self.path))?;
+        let zipfile = BufReader::new(StdFile::open(Path::new(&self.path))?);
         let mut zip = ZipArchive::new(zipfile)?;
-        let mut some_str = String::new();
         let mut some_file = zip.by_name(&path)?;
+        let mut some_str = String::with_capacity(presize(some_file.size()));
         some_file.read_to_string(&mut some_str)?;
         Ok(some_str)
     }
     pub fn get_xml_str_from_gldf(path: PathBuf) -> Result<String, Box<dyn StdError>> {
-        let zipfile = StdFile::open(path)?;
+        let zipfile = BufReader::new(StdFile::open(path)?);
         let mut zip = ZipArchive::new(zipfile)?;
         let mut xmlfile = zip.by_name("product.xml")?;
-        let mut xml_str = String::new();
+        let mut xml_str = String::with_capacity(presize(xmlfile.size()));
         xmlfile.read_to_string(&mut xml_str)?;
         Ok(xml_str)
     }
@@ -39,19 +48,12 @@ impl GldfProduct {
         Ok(loaded)
     }
     pub fn load_gldf_from_buf(file_buf: Vec<u8>) -> Result<GldfProduct, Box<dyn StdError>> {
-        let mut zip_buf = std::io::Cursor::new(file_buf);
+        let zip_buf = std::io::Cursor::new(file_buf);
         let mut zip = zip::ZipArchive::new(zip_buf)?;
-        for i in 0..zip.len()
-        {
-            let mut file = zip.by_index(i).unwrap();
-            println!("Filename: {}", file.name());
-            let first_byte = file.bytes().next().unwrap()?;
-            println!("{}", first_byte);
-        }
         let mut xmlfile = zip.by_name("product.xml")?;
-        let mut xml_str = String::new();
+        let mut xml_str = String::with_capacity(presize(xmlfile.size()));
         xmlfile.read_to_string(&mut xml_str)?;
-        let mut loaded: GldfProduct = GldfProduct::from_xml(&xml_str).unwrap();
+        let loaded: GldfProduct = GldfProduct::from_xml(&xml_str).unwrap();
         Ok(loaded)
     }
     pub fn to_json(self: &Self) -> Result<String, Box<dyn StdError>> {
@@ -82,15 +84,12 @@ impl GldfProduct {
     }
 
     pub fn get_ldc_by_id(self: &Self, file_id: String) -> Result<String, Box<dyn StdError>> {
-        let mut result: String = "".to_owned();
         for f in self.general_definitions.files.file.iter() {
             if f.id == file_id{
-                let mut ldc_path = "ldc/".to_owned();
-                let file_name = f.file_name.to_owned();
-                ldc_path.push_str(&file_name);
-                result.push_str(&self.load_gldf_file_str(ldc_path).unwrap());
+                let ldc_path = format!("ldc/{}", f.file_name);
+                return self.load_gldf_file_str(ldc_path);
             }
         }
-        Ok(result)
+        Ok("".to_owned())
     }
 }
\ No newline at end of file
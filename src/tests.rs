@@ -1,5 +1,5 @@
 use gldf::GldfProduct;
-use crate::{gldf, StdFile};
+use crate::{gldf, presize};
 
 
 #[test]
@@ -38,11 +38,7 @@ fn test_gldf_product_impls() {
 }
 
 fn read_a_file() -> std::io::Result<Vec<u8>> {
-    use std::io::Read;
-    let mut gldf_file = StdFile::open("./tests/data/test.gldf").unwrap();
-    let mut file_buf = Vec::new();
-    gldf_file.read_to_end(&mut file_buf);
-    return Ok(file_buf);
+    std::fs::read("./tests/data/test.gldf")
 }
 
 #[test]
@@ -75,3 +71,44 @@ fn test_gldf_get_phot_files() {
         println!("{}", f.file_name)
     }
 }
+
+#[test]
+fn test_presize_is_capped() {
+    assert_eq!(presize(12692), 12692);
+    assert_eq!(presize(u64::MAX), 16 * 1024 * 1024);
+}
+
+#[test]
+fn test_gldf_get_ldc_by_id() {
+    let loaded: GldfProduct = GldfProduct::load_gldf("./tests/data/test.gldf").unwrap();
+    let phot_file = loaded.get_phot_files().unwrap()[0].clone();
+    let ldc_content = loaded.get_ldc_by_id(phot_file.id.to_string()).unwrap();
+    assert!(!ldc_content.is_empty());
+    let ldc_path = format!("ldc/{}", phot_file.file_name);
+    assert_eq!(ldc_content, loaded.load_gldf_file_str(ldc_path).unwrap());
+    // Unknown ids yield an empty string
+    assert_eq!(loaded.get_ldc_by_id("no_such_id".to_string()).unwrap(), "");
+    // A known id whose file is missing from the container is an error, not a panic
+    let mut broken = loaded.clone();
+    for f in broken.general_definitions.files.file.iter_mut() {
+        if f.id == phot_file.id {
+            f.file_name = "missing.ldt".to_string();
+        }
+    }
+    assert!(broken.get_ldc_by_id(phot_file.id.to_string()).is_err());
+}
+
+#[test]
+fn test_gldf_from_buf_empty_and_directory_entries() {
+    use std::io::Write;
+    use zip::write::FileOptions;
+    let xml_str = GldfProduct::get_xml_str_from_gldf("./tests/data/test.gldf".into()).unwrap();
+    let mut zip = zip::ZipWriter::new(std::io::Cursor::new(Vec::new()));
+    zip.add_directory("ldc/", FileOptions::default()).unwrap();
+    zip.start_file("ldc/empty.ldt", FileOptions::default()).unwrap();
+    zip.start_file("product.xml", FileOptions::default()).unwrap();
+    zip.write_all(xml_str.as_bytes()).unwrap();
+    let file_buf = zip.finish().unwrap().into_inner();
+    let loaded: GldfProduct = GldfProduct::load_gldf_from_buf(file_buf).unwrap();
+    assert_eq!(loaded.to_xml().unwrap(), GldfProduct::from_xml(&xml_str).unwrap().to_xml().unwrap());
+}